@@ -13,7 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """This is the setup file for the project."""
-from __future__ import unicode_literals
 
 from setuptools import find_packages
 from setuptools import setup
@@ -416,7 +416,7 @@ class Aggregation(resource.SketchResource):
         if not error.check_return_status(response, logger):
             return "Unable to save the aggregation"
 
-        response_json = response.json()
+        response_json = error.get_response_json(response, logger)
         objects = response_json.get("objects")
         if not objects:
             return "Unable to determine ID of saved object."
@@ -31,6 +31,10 @@ class AggregationTest(unittest.TestCase):
         self.api_client = client.TimesketchApi("http://127.0.0.1", "test", "test")
         self.sketch = self.api_client.get_sketch(1)
 
+    def tearDown(self):
+        """Tear down test case."""
+        self.api_client.close()
+
     # pylint: disable=protected-access
     def test_init(self):
         """Tests the Aggregation init method."""
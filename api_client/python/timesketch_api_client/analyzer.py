@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Timesketch API analyzer result object."""
-from __future__ import unicode_literals
 
 import datetime
 import json
@@ -12,19 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Timesketch API client."""
-from __future__ import unicode_literals
 
+import asyncio
+from concurrent import futures
+import hashlib
 import os
 import logging
+import re
 import sys
+import threading
+import time
 
 # pylint: disable=wrong-import-order
-import bs4
 import requests
+from requests.adapters import HTTPAdapter
 
 # pylint: disable=redefined-builtin
 from requests.exceptions import ConnectionError
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
 import webbrowser
 
 # pylint: disable-msg=import-error
@@ -41,9 +47,89 @@ from . import user
 from . import version
 from . import sigma
 
+# requests_cache is an optional dependency, only needed for the on-disk
+# response cache.
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# httpx is an optional dependency, only needed for the asynchronous API. If
+# the h2 package is installed as well, requests are multiplexed over HTTP/2.
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # pylint: disable=unused-import
+
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
 
 logger = logging.getLogger("timesketch_api.client")
 
+# Authenticated sessions shared between TimesketchApi objects, keyed by
+# (host_uri, username, password digest, verify, auth_mode, cache_path). Each
+# entry is a [session, number of client objects using it, creation time]
+# list.
+_SESSION_CACHE = {}
+_SESSION_CACHE_LOCK = threading.Lock()
+
+# Status codes that indicate that a cached session, or its CSRF token, is no
+# longer accepted by the server.
+_SESSION_REJECTED_STATUS_CODES = frozenset(
+    (
+        definitions.HTTP_STATUS_CODE_BAD_REQUEST,
+        definitions.HTTP_STATUS_CODE_UNAUTHORIZED,
+        definitions.HTTP_STATUS_CODE_FORBIDDEN,
+    )
+)
+
+# Tags that carry the CSRF token in the Timesketch HTML pages.
+_CSRF_INPUT_TAG_RE = re.compile(r"<input\b[^>]*\bid=[\"']?csrf_token\b[^>]*>", re.I)
+_CSRF_META_TAG_RE = re.compile(r"<meta\b[^>]*\bname=[\"']?csrf-token\b[^>]*>", re.I)
+
+
+def _evict_cached_session(session_key, entry):
+    """Remove a session from the session cache, if it is still cached.
+
+    The session is left open for the client objects that still use it.
+
+    Args:
+        session_key: The key of the session in the session cache.
+        entry: The session cache entry that should be removed.
+    """
+    with _SESSION_CACHE_LOCK:
+        if _SESSION_CACHE.get(session_key) is entry:
+            del _SESSION_CACHE[session_key]
+
+
+def _get_tag_attribute(html, tag_re, attribute):
+    """Returns the value of an attribute of the first tag matching a regex.
+
+    Args:
+        html: String with the HTML document to scan.
+        tag_re: Compiled regular expression that matches the whole tag.
+        attribute: Name of the attribute to extract.
+
+    Returns:
+        String with the attribute value or None if not found.
+    """
+    tag_match = tag_re.search(html)
+    if not tag_match:
+        return None
+
+    attribute_match = re.search(
+        r"\b{0:s}=(?:\"([^\"]*)\"|'([^']*)'|([^\s>]+))".format(attribute),
+        tag_match.group(0),
+        re.I,
+    )
+    if not attribute_match:
+        return None
+    return next(group for group in attribute_match.groups() if group is not None)
+
 
 class TimesketchApi:
     """Timesketch API object
@@ -68,6 +154,27 @@ class TimesketchApi:
     # Default retry count for operations that attempt a retry.
     DEFAULT_RETRY_COUNT = 5
 
+    # Default size of the HTTP connection pool used by the session.
+    DEFAULT_POOL_MAXSIZE = 32
+
+    # Default number of threads used to prefetch resource data.
+    DEFAULT_PREFETCH_WORKERS = 8
+
+    # Default maximum number of requests in flight at the same time.
+    DEFAULT_CONCURRENCY = 8
+    # Number of seconds a cached session is shared with new client objects
+    # before they log in again, kept below the one hour lifetime of the
+    # CSRF token of the server.
+    SESSION_CACHE_TTL = 1800
+
+    # Number of seconds responses are kept in the on-disk response cache.
+    DEFAULT_CACHE_EXPIRY = 3600
+
+    # URL patterns of resources that rarely change and can be served from
+    # the on-disk response cache.
+    CACHED_URL_PATTERNS = ("*/api/v1/sketches/*/views/*",)
+
+    # pylint: disable=too-many-arguments
     def __init__(
         self,
         host_uri,
@@ -78,6 +185,9 @@ class TimesketchApi:
         client_secret="",
         auth_mode="userpass",
         create_session=True,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        cache_path=None,
+        concurrency=DEFAULT_CONCURRENCY,
     ):
         """Initializes the TimesketchApi object.
 
@@ -94,6 +204,18 @@ class TimesketchApi:
             create_session: Boolean indicating whether the client object
                 should create a session object. If set to False the
                 function "set_session" needs to be called before proceeding.
+            pool_maxsize: Maximum number of connections kept alive in the
+                HTTP connection pool of the session. Callers that run many
+                requests concurrently can raise this value.
+            cache_path: Optional path to a SQLite file used to cache GET
+                responses of saved views across runs, for up to
+                DEFAULT_CACHE_EXPIRY seconds. Each user gets a separate
+                cache file, named after the path with a suffix derived from
+                the username. Requires the requests_cache package and is
+                only used for 'userpass' and 'http-basic' sessions.
+            concurrency: Maximum number of API requests this client sends
+                at the same time, defaults to DEFAULT_CONCURRENCY. Batch
+                scripts that prefetch data can raise it up to pool_maxsize.
 
         Raises:
             ConnectionError: If the Timesketch server is unreachable.
@@ -102,8 +224,17 @@ class TimesketchApi:
         """
         self._host_uri = host_uri
         self.api_root = "{0:s}/api/v1".format(host_uri)
+        self._sketches_url = self.api_root + "/sketches/"
         self.credentials = None
         self._flow = None
+        self._pool_maxsize = pool_maxsize
+        self._cache_path = cache_path
+        self._concurrency = concurrency
+        self._session_key = None
+        self._session_entry = None
+        # Gates outbound requests so concurrent callers do not flood the
+        # server.
+        self.request_semaphore = threading.BoundedSemaphore(concurrency)
 
         if not create_session:
             self.session = None
@@ -153,6 +284,117 @@ class TimesketchApi:
         """Sets the session object."""
         self.session = session_object
 
+    def __enter__(self):
+        """Returns the client object, to be used as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the HTTP session when leaving the context."""
+        self.close()
+
+    def close(self):
+        """Closes the HTTP session.
+
+        Username/password sessions are cached and shared with other client
+        objects that connect to the same server with the same credentials.
+        New client objects reuse a cached session for up to
+        SESSION_CACHE_TTL seconds, or until a request made with it is
+        rejected. Closing a client object stops it from using the session,
+        and the session itself is closed once the last client object that
+        uses it is closed.
+        """
+        shared_session = None
+        sessions_to_close = []
+        if self._session_entry:
+            entry = self._session_entry
+            with _SESSION_CACHE_LOCK:
+                entry[1] -= 1
+                if entry[1] > 0:
+                    shared_session = entry[0]
+                else:
+                    if _SESSION_CACHE.get(self._session_key) is entry:
+                        del _SESSION_CACHE[self._session_key]
+                    sessions_to_close.append(entry[0])
+            self._session_key = None
+            self._session_entry = None
+
+        if self.session and self.session is not shared_session:
+            sessions_to_close.append(self.session)
+        self.session = None
+
+        for session in set(sessions_to_close):
+            session.close()
+
+    def _mount_adapter(self, session):
+        """Mount a pooled HTTP adapter with retries on the session.
+
+        Args:
+            session: Instance of requests.Session.
+        """
+        # Do not raise once the retries are exhausted, so the last response
+        # reaches the status checks of the callers.
+        retries = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self._pool_maxsize,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=False,
+            max_retries=retries,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+    def _new_http_session(self, username):
+        """Return a new HTTP session, backed by a response cache if configured.
+
+        Args:
+            username: User the session is authenticated as, used to keep
+                the cached responses of different users apart.
+
+        Returns:
+            Instance of requests.Session.
+        """
+        if not self._cache_path:
+            return requests.Session()
+
+        if requests_cache is None:
+            logger.warning(
+                "Unable to use the response cache, the requests_cache package "
+                "is not installed."
+            )
+            return requests.Session()
+
+        urls_expire_after = {
+            pattern: self.DEFAULT_CACHE_EXPIRY for pattern in self.CACHED_URL_PATTERNS
+        }
+        cache_root, cache_extension = os.path.splitext(self._cache_path)
+        user_digest = hashlib.sha256(username.encode("utf-8")).hexdigest()
+        return requests_cache.CachedSession(
+            cache_name=f"{cache_root}_{user_digest[:16]}{cache_extension}",
+            backend="sqlite",
+            allowable_methods=("GET",),
+            expire_after=requests_cache.DO_NOT_CACHE,
+            urls_expire_after=urls_expire_after,
+        )
+
+    def clear_cached_response(self, resource_url):
+        """Remove the cached response of a resource from the response cache.
+
+        Args:
+            resource_url: The full URL to the resource.
+        """
+        if requests_cache is None:
+            return
+
+        if not isinstance(self.session, requests_cache.CachedSession):
+            return
+
+        self.session.cache.delete(urls=[resource_url])
+
     def _authenticate_session(self, session, username, password):
         """Post username/password to authenticate the HTTP session.
 
@@ -160,34 +402,45 @@ class TimesketchApi:
             session: Instance of requests.Session.
             username: User username.
             password: User password.
+
+        Returns:
+            Boolean indicating whether the login succeeded.
         """
-        # Do a POST to the login handler to set up the session cookies
+        # Do a POST to the login handler to set up the session cookies. The
+        # session cookies are set on the redirect response, so there is no
+        # need to spend another round trip fetching the page it points to.
+        # The login handler only redirects if the credentials are accepted.
         data = {"username": username, "password": password}
-        session.post("{0:s}/login/".format(self._host_uri), data=data)
+        response = session.post(
+            "{0:s}/login/".format(self._host_uri), data=data, allow_redirects=False
+        )
+        return response.is_redirect
 
     def _set_csrf_token(self, session):
         """Retrieve CSRF token from the server and append to HTTP headers.
 
         Args:
             session: Instance of requests.Session.
+
+        Returns:
+            Boolean indicating whether the server accepted the request, which
+            is False if the HTTP Basic credentials of the session are wrong.
         """
         # Scrape the CSRF token from the response
         response = session.get(self._host_uri)
-        soup = bs4.BeautifulSoup(response.text, features="html.parser")
-
-        tag = soup.find(id="csrf_token")
-        csrf_token = None
-        if tag:
-            csrf_token = tag.get("value")
-        else:
-            tag = soup.find("meta", attrs={"name": "csrf-token"})
-            if tag:
-                csrf_token = tag.attrs.get("content")
-
+        csrf_token = _get_tag_attribute(response.text, _CSRF_INPUT_TAG_RE, "value")
         if not csrf_token:
-            return
+            csrf_token = _get_tag_attribute(response.text, _CSRF_META_TAG_RE, "content")
 
-        session.headers.update({"x-csrftoken": csrf_token, "referer": self._host_uri})
+        if csrf_token:
+            session.headers.update(
+                {"x-csrftoken": csrf_token, "referer": self._host_uri}
+            )
+
+        return response.status_code not in (
+            definitions.HTTP_STATUS_CODE_UNAUTHORIZED,
+            definitions.HTTP_STATUS_CODE_FORBIDDEN,
+        )
 
     def _create_oauth_session(
         self,
@@ -293,6 +546,8 @@ class TimesketchApi:
         Args:
             session: Authorized session object.
         """
+        self._mount_adapter(session)
+
         # Authenticate to the Timesketch backend.
         login_callback_url = "{0:s}{1:s}".format(
             self._host_uri, self.DEFAULT_OAUTH_API_CALLBACK
@@ -324,6 +579,10 @@ class TimesketchApi:
                 'userpass' (username/password combo), 'http-basic'
                 (HTTP Basic authentication) and oauth.
 
+        Sessions that are not OAUTH based are cached once authenticated
+        and shared between client objects connecting to the same server
+        with the same credentials.
+
         Returns:
             Instance of requests.Session.
         """
@@ -338,7 +597,72 @@ class TimesketchApi:
                 skip_open=True,
             )
 
-        session = requests.Session()
+        password_digest = hashlib.sha256((password or "").encode("utf-8")).hexdigest()
+        session_key = (
+            self._host_uri,
+            username,
+            password_digest,
+            verify,
+            auth_mode,
+            self._cache_path,
+        )
+        with _SESSION_CACHE_LOCK:
+            entry = _SESSION_CACHE.get(session_key)
+            if entry and time.monotonic() - entry[2] > self.SESSION_CACHE_TTL:
+                # Log in again before the CSRF token of the session expires.
+                del _SESSION_CACHE[session_key]
+                entry = None
+            if entry:
+                entry[1] += 1
+                self._session_key = session_key
+                self._session_entry = entry
+                return entry[0]
+
+        # Authenticate outside of the lock, so a slow server does not hold
+        # up clients of other servers.
+        session, authenticated = self._create_userpass_session(
+            username, password, verify=verify, auth_mode=auth_mode
+        )
+        if not authenticated:
+            return session
+
+        new_entry = [session, 0, time.monotonic()]
+        with _SESSION_CACHE_LOCK:
+            entry = _SESSION_CACHE.setdefault(session_key, new_entry)
+            entry[1] += 1
+
+        if entry is new_entry:
+            # Stop sharing the session once the server rejects a request.
+            def _evict_rejected_session(response, *unused_args, **unused_kwargs):
+                """Evict the session from the cache on rejected requests."""
+                if response.status_code in _SESSION_REJECTED_STATUS_CODES:
+                    _evict_cached_session(session_key, new_entry)
+
+            session.hooks["response"].append(_evict_rejected_session)
+        else:
+            # Another client object logged in at the same time.
+            session.close()
+
+        self._session_key = session_key
+        self._session_entry = entry
+        return entry[0]
+
+    def _create_userpass_session(self, username, password, verify, auth_mode):
+        """Create and authenticate a new HTTP session.
+
+        Args:
+            username: User to authenticate as.
+            password: User password.
+            verify: Verify server SSL certificate.
+            auth_mode: The authentication mode to use, either 'userpass' or
+                'http-basic'.
+
+        Returns:
+            A tuple with an instance of requests.Session and a boolean
+            indicating whether the session is authenticated.
+        """
+        session = self._new_http_session(username)
+        self._mount_adapter(session)
 
         # If using HTTP Basic auth, add the user/pass to the session
         if auth_mode == "http-basic":
@@ -351,11 +675,11 @@ class TimesketchApi:
             requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
 
         # Get and set CSRF token and authenticate the session if appropriate.
-        self._set_csrf_token(session)
+        authenticated = self._set_csrf_token(session)
         if auth_mode == "userpass":
-            self._authenticate_session(session, username, password)
+            authenticated = self._authenticate_session(session, username, password)
 
-        return session
+        return session, authenticated
 
     def fetch_resource_data(self, resource_uri, params=None):
         """Make a HTTP GET request.
@@ -372,17 +696,52 @@ class TimesketchApi:
                 DEFAULT_RETRY_COUNT attempts.
             RuntimeError: If the API server returns an error or empty.
         """
-        resource_url = "{0:s}/{1:s}".format(self.api_root, resource_uri)
+        result, _ = self.fetch_resource_data_with_etag(resource_uri, params=params)
+        return result
+
+    def fetch_resource_data_with_etag(self, resource_uri, etag=None, params=None):
+        """Make a conditional HTTP GET request.
+
+        If an ETag of a previous response is passed in, it is sent in an
+        If-None-Match header, and the server can answer with a 304 without
+        a response body if the resource has not changed.
+
+        Args:
+            resource_uri: The URI to the resource to be fetched.
+            etag: Optional ETag of a previously fetched response.
+            params: Dict of URL parameters to send in the GET request.
+
+        Returns:
+            A tuple with the dictionary with the response data, or None if
+            the resource was not modified, and the ETag of the response, or
+            None if the server did not send one.
+
+        Raises:
+            ValueError: If response could not be JSON-decoded after
+                DEFAULT_RETRY_COUNT attempts.
+            RuntimeError: If the API server returns an error or empty.
+        """
+        resource_url = self.api_root + "/" + resource_uri
+        headers = None
+        if etag:
+            headers = {"If-None-Match": etag}
 
         retry_count = 0
         result = None
         while True:
             retry_count += 1
-            response = self.session.get(resource_url, params=params)
+            with self.request_semaphore:
+                response = self.session.get(
+                    resource_url, params=params, headers=headers
+                )
+            if etag and (
+                response.status_code == definitions.HTTP_STATUS_CODE_NOT_MODIFIED
+            ):
+                return None, etag
             try:
                 result = error.get_response_json(response, logger)
                 if result:
-                    return result
+                    return result, response.headers.get("ETag")
             except RuntimeError as e:
                 if retry_count >= self.DEFAULT_RETRY_COUNT:
                     raise RuntimeError(
@@ -416,6 +775,153 @@ class TimesketchApi:
                     " - Response: '{1!s}'".format(resource_url, result)
                 )
 
+    def _create_async_client(self):
+        """Return an asynchronous HTTP client sharing the session state.
+
+        The client is authenticated with the cookies and headers of the
+        session and uses HTTP/2 if the h2 package is installed.
+
+        Returns:
+            Instance of httpx.AsyncClient.
+
+        Raises:
+            RuntimeError: If the httpx package is not installed.
+        """
+        if httpx is None:
+            raise RuntimeError(
+                "The httpx package is needed for the asynchronous API, "
+                "install it with 'pip install httpx[http2]'."
+            )
+
+        cookies = httpx.Cookies()
+        for cookie in self.session.cookies:
+            cookies.set(cookie.name, cookie.value, domain=cookie.domain)
+
+        return httpx.AsyncClient(
+            http2=HAS_HTTP2,
+            verify=self.session.verify,
+            auth=self.session.auth,
+            cookies=cookies,
+            headers=dict(self.session.headers),
+            limits=httpx.Limits(
+                max_connections=self._pool_maxsize,
+                max_keepalive_connections=self._pool_maxsize,
+            ),
+        )
+
+    async def _fetch_resource_data_async(self, client, resource_uri, params=None):
+        """Make an asynchronous HTTP GET request.
+
+        Args:
+            client: Instance of httpx.AsyncClient.
+            resource_uri: The URI to the resource to be fetched.
+            params: Dict of URL parameters to send in the GET request.
+
+        Returns:
+            Dictionary with the response data.
+
+        Raises:
+            RuntimeError: If the API server returns an error.
+        """
+        resource_url = self.api_root + "/" + resource_uri
+        response = await client.get(resource_url, params=params)
+        if response.status_code not in definitions.HTTP_STATUS_CODE_20X:
+            raise RuntimeError(
+                "Error for request '{0:s}' - [{1:d}] {2:s}".format(
+                    resource_url, response.status_code, response.reason_phrase
+                )
+            )
+        return error.decode_json(response.content, logger)
+
+    async def fetch_resource_data_async(self, resource_uris, params=None):
+        """Fetch several resources concurrently with asynchronous requests.
+
+        With HTTP/2 all the requests are multiplexed over a single
+        connection, otherwise up to pool_maxsize connections are used.
+
+        Args:
+            resource_uris: List of URIs to the resources to be fetched.
+            params: Dict of URL parameters to send in each GET request.
+
+        Returns:
+            List of dictionaries with the response data, in the same order
+            as the resource URIs.
+
+        Raises:
+            RuntimeError: If the httpx package is not installed or the API
+                server returns an error.
+        """
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def _fetch(client, resource_uri):
+            async with semaphore:
+                return await self._fetch_resource_data_async(
+                    client, resource_uri, params=params
+                )
+
+        async with self._create_async_client() as client:
+            return await asyncio.gather(*[_fetch(client, uri) for uri in resource_uris])
+
+    def map_concurrently(self, function, items, max_workers=None):
+        """Call a function on each item using a pool of threads.
+
+        The calls are expected to make API requests, which share the
+        connection pool of the session, so the number of threads is capped
+        by the size of the pool and the concurrency limit of the client.
+
+        Args:
+            function: Function that takes a single item as an argument.
+            items: List of items to call the function on.
+            max_workers: Optional number of threads to use, defaults to
+                DEFAULT_PREFETCH_WORKERS.
+
+        Returns:
+            List with the return values of the function, in the same order
+            as the items.
+        """
+        if not items:
+            return []
+
+        workers = min(
+            max_workers or self.DEFAULT_PREFETCH_WORKERS,
+            self._pool_maxsize,
+            self._concurrency,
+            len(items),
+        )
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(function, items))
+
+    def prefetch_resource_data(self, resources, max_workers=None):
+        """Load the data of several resources concurrently.
+
+        Resources that fail to load are logged and skipped, their data is
+        then loaded on first access as if they had not been prefetched.
+
+        Args:
+            resources: List of resource objects (instances of
+                resource.BaseResource) to load the data for.
+            max_workers: Optional number of threads to use, defaults to
+                DEFAULT_PREFETCH_WORKERS.
+        """
+
+        def _prefetch(resource_obj):
+            """Load the data of a single resource, logging any errors."""
+            try:
+                resource_obj.lazyload_data()
+            except (
+                RuntimeError,
+                ValueError,
+                requests.exceptions.RequestException,
+            ) as e:
+                logger.warning(
+                    "Unable to prefetch the data of '%s', it will be loaded "
+                    "on access: %s",
+                    resource_obj.resource_uri,
+                    e,
+                )
+
+        self.map_concurrently(_prefetch, resources, max_workers=max_workers)
+
     def create_sketch(self, name, description=None):
         """Create a new sketch.
 
@@ -435,10 +941,10 @@ class TimesketchApi:
 
         retry_count = 0
         objects = None
+        form_data = {"name": name, "description": description}
         while True:
-            resource_url = "{0:s}/sketches/".format(self.api_root)
-            form_data = {"name": name, "description": description}
-            response = self.session.post(resource_url, json=form_data)
+            with self.request_semaphore:
+                response = self.session.post(self._sketches_url, json=form_data)
             response_dict = error.get_response_json(response, logger)
             objects = response_dict.get("objects")
             if objects:
@@ -574,7 +1080,9 @@ class TimesketchApi:
 
         return pandas.DataFrame(lines)
 
-    def list_sketches(self, per_page=50, scope="user", include_archived=True):
+    def list_sketches(
+        self, per_page=50, scope="user", include_archived=True, prefetch=False
+    ):
         """Get a list of all open sketches that the user has access to.
 
         Args:
@@ -587,6 +1095,9 @@ class TimesketchApi:
                 archived: get archived sketches
                 search: pass additional search query
             include_archived: If archived sketches should be returned.
+            prefetch: If set to True the data of all sketches in a page is
+                fetched concurrently before the sketches are yielded, instead
+                of lazily on first access of each sketch.
 
         Yields:
             Sketch objects instances.
@@ -609,13 +1120,20 @@ class TimesketchApi:
             if not page:
                 has_next_page = False
 
-            for sketch_dict in response.get("objects", []):
-                sketch_id = sketch_dict["id"]
-                sketch_name = sketch_dict["name"]
-                sketch_obj = sketch.Sketch(
-                    sketch_id=sketch_id, api=self, sketch_name=sketch_name
+            sketch_class = sketch.Sketch
+            sketches = [
+                sketch_class(
+                    sketch_id=sketch_dict["id"],
+                    api=self,
+                    sketch_name=sketch_dict["name"],
                 )
-                yield sketch_obj
+                for sketch_dict in response.get("objects", [])
+            ]
+
+            if prefetch:
+                self.prefetch_resource_data(sketches)
+
+            yield from sketches
 
     def get_searchindex(self, searchindex_id):
         """Get a searchindex.
@@ -12,10 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for the Timesketch API client"""
-from __future__ import unicode_literals
 
+import asyncio
+from concurrent import futures
+import http.server
+import os
+import tempfile
+import threading
+import time
 import unittest
 import mock
+import requests
 
 from . import client
 from . import sketch as sketch_lib
@@ -30,11 +37,77 @@ class TimesketchApiTest(unittest.TestCase):
         """Setup test case."""
         self.api_client = client.TimesketchApi("http://127.0.0.1", "test", "test")
 
+    def tearDown(self):
+        """Tear down test case."""
+        self.api_client.close()
+
     def test_fetch_resource_data(self):
         """Test fetch resource."""
         response = self.api_client.fetch_resource_data("sketches/")
         self.assertIsInstance(response, dict)
 
+    def test_fetch_resource_data_with_etag(self):
+        """Test conditional fetching of a resource."""
+        response = mock.Mock(status_code=304)
+        with mock.patch.object(
+            self.api_client.session, "get", return_value=response
+        ) as mock_get:
+            data, etag = self.api_client.fetch_resource_data_with_etag(
+                "sketches/1", etag="etag1"
+            )
+        self.assertIsNone(data)
+        self.assertEqual(etag, "etag1")
+        mock_get.assert_called_once_with(
+            "http://127.0.0.1/api/v1/sketches/1",
+            params=None,
+            headers={"If-None-Match": "etag1"},
+        )
+
+    @unittest.skipIf(client.httpx is None, "httpx not installed")
+    def test_fetch_resource_data_async(self):
+        """Test fetching resources concurrently with asynchronous requests."""
+
+        def handler(request):
+            sketch_id = int(request.url.path.rstrip("/").rpartition("/")[2])
+            return client.httpx.Response(200, json={"objects": [{"id": sketch_id}]})
+
+        transport = client.httpx.MockTransport(handler)
+        with mock.patch.object(
+            self.api_client,
+            "_create_async_client",
+            return_value=client.httpx.AsyncClient(transport=transport),
+        ):
+            results = asyncio.run(
+                self.api_client.fetch_resource_data_async(
+                    ["sketches/1/", "sketches/2/"]
+                )
+            )
+        self.assertEqual([x["objects"][0]["id"] for x in results], [1, 2])
+
+    def test_request_semaphore(self):
+        """Test that the number of requests in flight is bounded."""
+        api_client = client.TimesketchApi(
+            "http://127.0.0.1", "test", create_session=False, concurrency=2
+        )
+        api_client.set_session(test_lib.mock_session())
+        lock = threading.Lock()
+        in_flight = []
+        max_in_flight = []
+
+        def slow_get(*args, **kwargs):
+            with lock:
+                in_flight.append(1)
+                max_in_flight.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.pop()
+            return test_lib.mock_response(*args, **kwargs)
+
+        with mock.patch.object(api_client.session, "get", side_effect=slow_get):
+            with futures.ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(api_client.fetch_resource_data, ["sketches/"] * 8))
+        self.assertLessEqual(max(max_in_flight), 2)
+
     # TODO: Add test for create_sketch()
 
     def test_get_sketch(self):
@@ -51,3 +124,239 @@ class TimesketchApiTest(unittest.TestCase):
         self.assertIsInstance(sketches, list)
         self.assertEqual(len(sketches), 1)
         self.assertIsInstance(sketches[0], sketch_lib.Sketch)
+
+    def test_get_sketches_prefetch(self):
+        """Test to get a list of sketches with prefetched data."""
+        sketches = list(self.api_client.list_sketches(prefetch=True))
+        self.assertEqual(len(sketches), 1)
+        self.assertIsNotNone(sketches[0].resource_data)
+        self.assertEqual(sketches[0].description, "test")
+
+    def test_get_sketches_prefetch_error(self):
+        """Test that a failed prefetch leaves the data to be loaded lazily."""
+        fetch = self.api_client.fetch_resource_data_with_etag
+
+        def failing_fetch(resource_uri, *args, **kwargs):
+            if resource_uri != "sketches/":
+                raise RuntimeError("Unable to fetch")
+            return fetch(resource_uri, *args, **kwargs)
+
+        with mock.patch.object(
+            self.api_client, "fetch_resource_data_with_etag", side_effect=failing_fetch
+        ):
+            with self.assertLogs("timesketch_api.client", level="WARNING"):
+                sketches = list(self.api_client.list_sketches(prefetch=True))
+        self.assertEqual(len(sketches), 1)
+        self.assertIsNone(sketches[0].resource_data)
+
+        with mock.patch.object(
+            self.api_client, "fetch_resource_data_with_etag", wraps=fetch
+        ) as mock_fetch:
+            self.assertEqual(sketches[0].description, "test")
+        mock_fetch.assert_called_once()
+
+    @mock.patch("requests.Session", test_lib.mock_session)
+    def test_session_cache(self):
+        """Test that sessions are shared between client objects."""
+        api_client = client.TimesketchApi("http://127.0.0.1", "cache", "test")
+        session = api_client.session
+        other_client = client.TimesketchApi("http://127.0.0.1", "cache", "test")
+        self.assertIs(other_client.session, session)
+
+        with mock.patch.object(session, "close") as mock_close:
+            other_client.close()
+            self.assertIsNone(other_client.session)
+            mock_close.assert_not_called()
+
+            new_client = client.TimesketchApi("http://127.0.0.1", "cache", "test")
+            self.assertIs(new_client.session, session)
+            new_client.close()
+            mock_close.assert_not_called()
+
+            api_client.close()
+            mock_close.assert_called_once_with()
+
+        new_client = client.TimesketchApi("http://127.0.0.1", "cache", "test")
+        self.assertIsNot(new_client.session, session)
+        new_client.close()
+
+    @mock.patch("requests.Session", test_lib.mock_session)
+    def test_session_cache_expiry(self):
+        """Test that cached sessions are not shared after they expire."""
+        api_client = client.TimesketchApi("http://127.0.0.1", "expiry", "test")
+        with mock.patch.object(client.TimesketchApi, "SESSION_CACHE_TTL", -1):
+            other_client = client.TimesketchApi("http://127.0.0.1", "expiry", "test")
+        self.assertIsNot(other_client.session, api_client.session)
+
+        new_client = client.TimesketchApi("http://127.0.0.1", "expiry", "test")
+        self.assertIs(new_client.session, other_client.session)
+        for client_object in (api_client, other_client, new_client):
+            client_object.close()
+
+    @mock.patch("requests.Session", test_lib.mock_session)
+    def test_session_cache_rejected(self):
+        """Test that a session is evicted once the server rejects it."""
+        api_client = client.TimesketchApi("http://127.0.0.1", "rejected", "test")
+        session = api_client.session
+        for hook in session.hooks["response"]:
+            hook(mock.Mock(status_code=200))
+        other_client = client.TimesketchApi("http://127.0.0.1", "rejected", "test")
+        self.assertIs(other_client.session, session)
+
+        with mock.patch.object(session, "close") as mock_close:
+            for hook in session.hooks["response"]:
+                hook(mock.Mock(status_code=400))
+            new_client = client.TimesketchApi("http://127.0.0.1", "rejected", "test")
+            self.assertIsNot(new_client.session, session)
+
+            other_client.close()
+            mock_close.assert_not_called()
+            api_client.close()
+            mock_close.assert_called_once_with()
+        new_client.close()
+
+    @mock.patch("requests.Session", test_lib.mock_session)
+    def test_context_manager(self):
+        """Test that the client closes its session when used in a context."""
+        with client.TimesketchApi("http://127.0.0.1", "context", "test") as api:
+            self.assertIsNotNone(api.session)
+        self.assertIsNone(api.session)
+        # pylint: disable=protected-access
+        self.assertFalse([key for key in client._SESSION_CACHE if key[1] == "context"])
+
+    @mock.patch("requests.Session", test_lib.mock_session)
+    def test_session_cache_credentials(self):
+        """Test that sessions are only shared for the same credentials."""
+        other_client = client.TimesketchApi("http://127.0.0.1", "test", "other")
+        self.assertIsNot(other_client.session, self.api_client.session)
+        other_client.close()
+
+        with mock.patch.object(
+            client.TimesketchApi, "_authenticate_session", return_value=False
+        ):
+            failed_client = client.TimesketchApi("http://127.0.0.1", "test", "bad")
+            other_client = client.TimesketchApi("http://127.0.0.1", "test", "bad")
+        self.assertIsNot(failed_client.session, other_client.session)
+        failed_client.close()
+        other_client.close()
+
+    def test_authenticate_session(self):
+        """Test that the login redirect is not followed."""
+        session = mock.Mock()
+        # pylint: disable=protected-access
+        self.api_client._authenticate_session(session, "test", "test")
+        session.post.assert_called_once_with(
+            "http://127.0.0.1/login/",
+            data={"username": "test", "password": "test"},
+            allow_redirects=False,
+        )
+
+    def test_get_tag_attribute(self):
+        """Test extracting the CSRF token from HTML."""
+        # pylint: disable=protected-access
+        html = '<input id="csrf_token" name="csrf_token" type="hidden" value="abc">'
+        self.assertEqual(
+            client._get_tag_attribute(html, client._CSRF_INPUT_TAG_RE, "value"),
+            "abc",
+        )
+        html = "<head><meta name=csrf-token content='def'><title>TS</title>"
+        self.assertEqual(
+            client._get_tag_attribute(html, client._CSRF_META_TAG_RE, "content"),
+            "def",
+        )
+        html = "<head><meta name=csrf-token content=ghi></head>"
+        self.assertEqual(
+            client._get_tag_attribute(html, client._CSRF_META_TAG_RE, "content"),
+            "ghi",
+        )
+        self.assertIsNone(
+            client._get_tag_attribute(
+                "<html></html>", client._CSRF_INPUT_TAG_RE, "value"
+            )
+        )
+
+    @unittest.skipIf(client.requests_cache is None, "requests_cache not installed")
+    def test_new_http_session_cache(self):
+        """Test that only saved view responses are cached, per user."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            api_client = client.TimesketchApi(
+                "http://127.0.0.1",
+                "test",
+                create_session=False,
+                cache_path=os.path.join(temp_dir, "cache.sqlite"),
+            )
+            # pylint: disable=protected-access
+            session = api_client._new_http_session("test")
+            other_session = api_client._new_http_session("other")
+            self.assertIsInstance(session, client.requests_cache.CachedSession)
+            self.assertEqual(session.settings.allowable_methods, ("GET",))
+            self.assertEqual(
+                session.settings.urls_expire_after,
+                {"*/api/v1/sketches/*/views/*": 3600},
+            )
+            self.assertTrue(session.cache.cache_name.endswith(".sqlite"))
+            self.assertNotEqual(
+                session.cache.cache_name, other_session.cache.cache_name
+            )
+
+            url = "http://127.0.0.1/api/v1/sketches/1/views/1/"
+            api_client.set_session(session)
+            with mock.patch.object(session.cache, "delete") as mock_delete:
+                api_client.clear_cached_response(url)
+            mock_delete.assert_called_once_with(urls=[url])
+            session.close()
+            other_session.close()
+
+    def test_mount_adapter(self):
+        """Test that a pooled adapter is mounted on the session."""
+        api_client = client.TimesketchApi(
+            "http://127.0.0.1", "test", create_session=False, pool_maxsize=64
+        )
+        session = requests.Session()
+        api_client._mount_adapter(session)  # pylint: disable=protected-access
+        adapter = session.get_adapter("https://127.0.0.1")
+        self.assertIs(adapter, session.get_adapter("http://127.0.0.1"))
+        self.assertEqual(adapter._pool_maxsize, 64)  # pylint: disable=protected-access
+
+    def test_authenticate_oauth_session(self):
+        """Test that OAUTH sessions get the pooled adapter."""
+        session = mock.Mock()
+        session.get.return_value = mock.Mock(status_code=200, text="")
+        with mock.patch.object(self.api_client, "_mount_adapter") as mock_mount:
+            self.api_client.authenticate_oauth_session(session)
+        mock_mount.assert_called_once_with(session)
+
+    @mock.patch.object(client.Retry, "sleep", mock.Mock())
+    def test_mount_adapter_retry_status(self):
+        """Test that exhausted status retries surface as a RuntimeError."""
+
+        class UnavailableHandler(http.server.BaseHTTPRequestHandler):
+            """Answers every request with a 503."""
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """Handle a GET request."""
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                """Silence the request log."""
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), UnavailableHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            api_client = client.TimesketchApi(
+                "http://127.0.0.1:{0:d}".format(server.server_address[1]),
+                "test",
+                create_session=False,
+            )
+            session = requests.Session()
+            api_client._mount_adapter(session)  # pylint: disable=protected-access
+            api_client.set_session(session)
+            with self.assertRaises(RuntimeError):
+                api_client.fetch_resource_data("sketches/")
+            session.close()
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for the Timesketch config library for the API client."""
-from __future__ import unicode_literals
 
 import unittest
 import tempfile
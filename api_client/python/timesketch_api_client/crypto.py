@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Timesketch API crypto storage library for OAUTH client."""
-from __future__ import unicode_literals
 
 import base64
 import os
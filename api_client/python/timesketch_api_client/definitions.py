@@ -18,6 +18,7 @@
 HTTP_STATUS_CODE_OK = 200
 HTTP_STATUS_CODE_CREATED = 201
 HTTP_STATUS_CODE_REDIRECT = 302
+HTTP_STATUS_CODE_NOT_MODIFIED = 304
 HTTP_STATUS_CODE_BAD_REQUEST = 400
 HTTP_STATUS_CODE_UNAUTHORIZED = 401
 HTTP_STATUS_CODE_FORBIDDEN = 403
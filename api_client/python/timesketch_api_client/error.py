@@ -12,12 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Timesketch API client library."""
-from __future__ import unicode_literals
 
 import json
 
 import bs4
 
+# orjson is an optional dependency that decodes large responses faster.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from . import definitions
 
 
@@ -93,8 +98,32 @@ def get_response_json(response, logger):
             message=("Failed to get a valid response json from Timesketch API"),
         )
 
+    return decode_json(response.content, logger)
+
+
+def decode_json(content, logger):
+    """Return the decoded JSON object from the raw content of a response.
+
+    Args:
+        content (bytes): the raw body of a HTTP response.
+        logger (logging.Logger): a logger object that can be used to write log
+          messages.
+
+    Returns:
+        dict: a dict with the decoded JSON object.
+
+    Raises:
+        ValueError: if the content cannot be JSON decoded.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN and Infinity, which the json module accepts.
+            pass
+
     try:
-        return response.json()
+        return json.loads(content)
     except json.JSONDecodeError as e:
         logger.warning("Unable to json decode the Timesketch API response!")
         raise ValueError("Unable to json decode the Timesketch API response!") from e
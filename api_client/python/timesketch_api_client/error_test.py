@@ -0,0 +1,45 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Timesketch API client error handling."""
+
+import logging
+import math
+import unittest
+
+from . import error
+
+
+class DecodeJsonTest(unittest.TestCase):
+    """Test the decode_json function."""
+
+    def setUp(self):
+        """Setup test case."""
+        self.logger = logging.getLogger("timesketch_api.error_test")
+
+    def test_decode_json(self):
+        """Test decoding a JSON response."""
+        self.assertEqual(
+            error.decode_json(b'{"a": [1, 2]}', self.logger), {"a": [1, 2]}
+        )
+
+    def test_decode_json_nan(self):
+        """Test decoding NaN and Infinity values."""
+        data = error.decode_json(b'{"a": NaN, "b": Infinity}', self.logger)
+        self.assertTrue(math.isnan(data["a"]))
+        self.assertEqual(data["b"], math.inf)
+
+    def test_decode_json_invalid(self):
+        """Test decoding invalid JSON."""
+        with self.assertRaises(ValueError):
+            error.decode_json(b"<html></html>", self.logger)
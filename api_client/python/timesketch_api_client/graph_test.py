@@ -29,6 +29,10 @@ class GraphTest(unittest.TestCase):
         self.api_client = client.TimesketchApi("http://127.0.0.1", "test", "test")
         self.sketch = self.api_client.get_sketch(1)
 
+    def tearDown(self):
+        """Tear down test case."""
+        self.api_client.close()
+
     def test_from_manual(self):
         """Test setting up a graph from manual."""
         data = {0: {1: {"weight": 1}}}
@@ -13,6 +13,31 @@
 # limitations under the License.
 """Timesketch API client library."""
 import json
+import logging
+import threading
+
+
+logger = logging.getLogger("timesketch_api.resource")
+
+
+class _LazyJson:
+    """Defers JSON serialization of an object until it is formatted.
+
+    Used as a logging argument, so the payload is only serialized if the
+    log record is actually emitted.
+    """
+
+    def __init__(self, obj):
+        """Initialize the object.
+
+        Args:
+            obj: The object to serialize.
+        """
+        self._obj = obj
+
+    def __str__(self):
+        """Returns the object serialized as indented JSON."""
+        return json.dumps(self._obj, indent=2)
 
 
 class BaseResource:
@@ -28,20 +53,49 @@ class BaseResource:
         self.api = api
         self.resource_uri = resource_uri
         self.resource_data = None
+        self._data_lock = threading.Lock()
+        self._etag = None
 
     def lazyload_data(self, refresh_cache=False):
         """Load resource data once and cache the result.
 
+        The data is only fetched once even if the resource is accessed from
+        several threads at the same time. When the cache is refreshed the
+        request is conditional on the ETag of the cached data, so the body
+        is only transferred if the resource changed.
+
         Args:
             refresh_cache: Boolean indicating if to update cache.
 
         Returns:
             Dictionary with resource data.
         """
-        if not self.resource_data or refresh_cache:
-            self.resource_data = self.api.fetch_resource_data(self.resource_uri)
+        if self.resource_data and not refresh_cache:
+            return self.resource_data
+
+        with self._data_lock:
+            if not self.resource_data or refresh_cache:
+                etag = self._etag if self.resource_data else None
+                data, self._etag = self.api.fetch_resource_data_with_etag(
+                    self.resource_uri, etag=etag
+                )
+                if data is not None:
+                    self.resource_data = data
+                    logger.debug(
+                        "Loaded resource data for %s: %s",
+                        self.resource_uri,
+                        _LazyJson(data),
+                    )
         return self.resource_data
 
+    def refresh(self):
+        """Revalidate the cached resource data against the server.
+
+        Returns:
+            Dictionary with resource data.
+        """
+        return self.lazyload_data(refresh_cache=True)
+
     @property
     def data(self):
         """Property to fetch resource data.
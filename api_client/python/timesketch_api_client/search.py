@@ -15,6 +15,7 @@
 import datetime
 import json
 import logging
+import math
 import re
 
 import pandas
@@ -443,6 +444,7 @@ class Search(resource.SketchResource):
         self._indices = "_all"
         self._max_entries = self.DEFAULT_SIZE_LIMIT
         self._name = ""
+        self._page_size = 0
         self._query_dsl = ""
         self._query_filter = {}
         self._query_string = ""
@@ -489,6 +491,77 @@ class Search(resource.SketchResource):
 
             self.add_chip(chip)
 
+    def _execute_paged_query(self, form_data):
+        """Execute a search request as concurrent requests for result pages.
+
+        Instead of scrolling through the results one request at a time, the
+        first page of page_size events is fetched to learn how many events
+        match the query. The remaining pages, up to max_entries, are then
+        fetched concurrently and stitched together in order.
+
+        Args:
+            form_data (dict): the form data of the search request.
+        """
+        page_size = self._page_size
+        max_size = min(
+            self.max_entries or self.DEFAULT_SIZE_LIMIT, self.DEFAULT_SIZE_LIMIT
+        )
+        resource_url = f"{self.api.api_root}/{self.resource_uri}"
+
+        def _fetch_page(page):
+            """Fetch a single page of results."""
+            page_filter = dict(form_data["filter"])
+            page_filter["from"] = page * page_size
+            page_filter["size"] = min(page_size, max_size - page * page_size)
+            page_filter["terminate_after"] = max_size
+
+            page_form_data = dict(form_data)
+            page_form_data["filter"] = page_filter
+            page_form_data["enable_scroll"] = False
+
+            with self.api.request_semaphore:
+                response = self.api.session.post(resource_url, json=page_form_data)
+            if not error.check_return_status(response, logger):
+                error.error_message(
+                    response, message="Unable to query results", error=ValueError
+                )
+            return error.get_response_json(response, logger)
+
+        response_json = _fetch_page(0)
+        response_json.setdefault("objects", [])
+        response_meta = response_json.setdefault("meta", {})
+
+        total_size = min(response_meta.get("es_total_count", 0), max_size)
+        pages = int(math.ceil(total_size / page_size))
+        page_responses = self.api.map_concurrently(_fetch_page, list(range(1, pages)))
+
+        for page_response in page_responses:
+            response_json["objects"].extend(page_response.get("objects", []))
+            added_time = page_response.get("meta", {}).get("es_time", 0)
+            response_meta["es_time"] = response_meta.get("es_time", 0) + added_time
+
+        self._store_response(response_json, len(response_json["objects"]))
+
+    def _store_response(self, response_json, total_count):
+        """Store the results of a search request.
+
+        Args:
+            response_json (dict): the decoded search response, with the
+                results of all the requests that were made.
+            total_count (int): the number of results in the response.
+        """
+        self._total_elastic_size = response_json.get("meta", {}).get(
+            "es_total_count", 0
+        )
+        if self._total_elastic_size != total_count:
+            logger.info(
+                "%d results were returned, but %d records matched the search query",
+                total_count,
+                self._total_elastic_size,
+            )
+
+        self._raw_response = response_json
+
     def _execute_query(self, file_name="", count=False):
         """Execute a search request and store the results.
 
@@ -520,9 +593,14 @@ class Search(resource.SketchResource):
             "file_name": file_name,
         }
 
-        response = self.api.session.post(
-            f"{self.api.api_root}/{self.resource_uri}", json=form_data
-        )
+        if self._page_size and not (count or file_name):
+            self._execute_paged_query(form_data)
+            return
+
+        with self.api.request_semaphore:
+            response = self.api.session.post(
+                f"{self.api.api_root}/{self.resource_uri}", json=form_data
+            )
         if not error.check_return_status(response, logger):
             error.error_message(
                 response, message="Unable to query results", error=ValueError
@@ -553,9 +631,10 @@ class Search(resource.SketchResource):
                 logger.debug("No scroll ID, will stop.")
                 break
 
-            more_response = self.api.session.post(
-                f"{self.api.api_root}/{self.resource_uri}", json=form_data
-            )
+            with self.api.request_semaphore:
+                more_response = self.api.session.post(
+                    f"{self.api.api_root}/{self.resource_uri}", json=form_data
+                )
             if not error.check_return_status(more_response, logger):
                 error.error_message(
                     response, message="Unable to query results", error=ValueError
@@ -568,17 +647,7 @@ class Search(resource.SketchResource):
             added_time = more_meta.get("es_time", 0)
             response_json["meta"]["es_time"] += added_time
 
-        self._total_elastic_size = response_json.get("meta", {}).get(
-            "es_total_count", 0
-        )
-        if self._total_elastic_size != total_count:
-            logger.info(
-                "%d results were returned, but %d records matched the search query",
-                total_count,
-                self._total_elastic_size,
-            )
-
-        self._raw_response = response_json
+        self._store_response(response_json, total_count)
 
     def add_chip(self, chip):
         """Add a chip to the ..."""
@@ -628,6 +697,7 @@ class Search(resource.SketchResource):
             f"{self._resource_id}/"
         )
         response = self.api.session.delete(resource_url)
+        self.api.clear_cached_response(resource_url)
         return error.check_return_status(response, logger)
 
     @property
@@ -873,6 +943,26 @@ class Search(resource.SketchResource):
         self._query_filter["order"] = "desc"
         self.commit()
 
+    @property
+    def page_size(self):
+        """Property that returns the page size of concurrent result fetching.
+
+        When set, the results up to max_entries are fetched as concurrent
+        requests for pages of page_size events instead of by scrolling.
+        A value of 0 (the default) disables paging.
+        """
+        return self._page_size
+
+    @page_size.setter
+    def page_size(self, page_size):
+        """Make changes to the page size of concurrent result fetching."""
+        if page_size < 0:
+            raise ValueError("Page size needs to be a positive integer.")
+        # The page size only changes how results are fetched, so it is not
+        # committed to a saved search.
+        self._page_size = page_size
+        self._raw_response = None
+
     @property
     def query_dsl(self):
         """Property that returns back the query DSL."""
@@ -1032,6 +1122,8 @@ class Search(resource.SketchResource):
             "labels": json.dumps(self.labels),
         }
         response = self.api.session.post(resource_url, json=data)
+        if self._resource_id:
+            self.api.clear_cached_response(resource_url)
         status = error.check_return_status(response, logger)
         if not status:
             error.error_message(response, "Unable to save search", error=RuntimeError)
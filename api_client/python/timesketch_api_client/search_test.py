@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for the Timesketch API client"""
+import json
 import unittest
 import mock
 
@@ -29,6 +30,10 @@ class SearchTest(unittest.TestCase):
         self.api_client = client.TimesketchApi("http://127.0.0.1", "test", "test")
         self.sketch = self.api_client.get_sketch(1)
 
+    def tearDown(self):
+        """Tear down test case."""
+        self.api_client.close()
+
     def test_from_saved(self):
         """Test fetching object from store."""
         search_obj = search.Search(sketch=self.sketch)
@@ -41,6 +46,34 @@ class SearchTest(unittest.TestCase):
 
         self.assertEqual(query_filter.get("chips"), [])
 
+    def test_page_size_not_saved(self):
+        """Test that setting the page size does not save a saved search."""
+        search_obj = search.Search(sketch=self.sketch)
+        search_obj.from_saved(1)
+        with mock.patch.object(search_obj, "save") as mock_save:
+            search_obj.page_size = 10
+        mock_save.assert_not_called()
+        self.assertEqual(search_obj.page_size, 10)
+
+    def test_save_and_delete_clear_cache(self):
+        """Test that saving and deleting evicts the cached saved search."""
+        search_obj = search.Search(sketch=self.sketch)
+        search_obj.from_saved(1)
+        search_url = "http://127.0.0.1/api/v1/sketches/1/views/1/"
+        with mock.patch.object(self.api_client, "clear_cached_response") as mock_clear:
+            search_obj.save()
+            mock_clear.assert_called_once_with(search_url)
+
+            mock_clear.reset_mock()
+            with mock.patch.object(
+                self.api_client.session,
+                "delete",
+                side_effect=test_lib.mock_response,
+                create=True,
+            ):
+                search_obj.delete()
+            mock_clear.assert_called_once_with(search_url)
+
     def test_from_manual(self):
         """Test fetching data."""
         search_obj = search.Search(sketch=self.sketch)
@@ -55,6 +88,58 @@ class SearchTest(unittest.TestCase):
         objects = search_dict.get("objects", [])
         self.assertEqual(len(objects), 1)
 
+    def _mock_explore_post(self, total_count):
+        """Returns a mock POST handler for a query with total_count hits."""
+
+        def post(*unused_args, **kwargs):
+            query_filter = kwargs["json"]["filter"]
+            start = query_filter["from"]
+            stop = min(start + query_filter["size"], total_count)
+            response_data = {
+                "meta": {"es_time": 12, "es_total_count": total_count},
+                "objects": [{"_id": str(x)} for x in range(start, stop)],
+            }
+            return mock.Mock(
+                status_code=200, content=json.dumps(response_data).encode("utf-8")
+            )
+
+        return post
+
+    def test_paged_query(self):
+        """Test fetching results in concurrent pages."""
+        search_obj = search.Search(sketch=self.sketch)
+        search_obj.query_string = "*"
+        search_obj.max_entries = 10
+        search_obj.page_size = 1
+        with mock.patch.object(
+            self.api_client.session, "post", side_effect=self._mock_explore_post(3)
+        ) as mock_post:
+            search_dict = search_obj.to_dict()
+
+        self.assertEqual(mock_post.call_count, 3)
+        offsets = sorted(
+            call.kwargs["json"]["filter"].get("from")
+            for call in mock_post.call_args_list
+        )
+        self.assertEqual(offsets, [0, 1, 2])
+        objects = search_dict.get("objects", [])
+        self.assertEqual([x["_id"] for x in objects], ["0", "1", "2"])
+        self.assertEqual(search_dict.get("meta", {}).get("es_time"), 36)
+        self.assertEqual(search_obj.expected_size, 3)
+
+    def test_paged_query_few_results(self):
+        """Test that only pages with results are fetched."""
+        search_obj = search.Search(sketch=self.sketch)
+        search_obj.query_string = "*"
+        search_obj.page_size = 100
+        with mock.patch.object(
+            self.api_client.session, "post", side_effect=self._mock_explore_post(5)
+        ) as mock_post:
+            search_dict = search_obj.to_dict()
+
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(len(search_dict.get("objects", [])), 5)
+
     def test_range_chip(self):
         """Test date range chip."""
         chip = search.DateRangeChip()
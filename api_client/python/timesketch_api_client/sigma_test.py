@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for the Timesketch API client"""
-from __future__ import unicode_literals
 
 import unittest
 import mock
@@ -62,6 +61,10 @@ class TimesketchSigmaRuleTest(unittest.TestCase):
         """Setup test case."""
         self.api_client = client.TimesketchApi("http://127.0.0.1", "test", "test")
 
+    def tearDown(self):
+        """Tear down test case."""
+        self.api_client.close()
+
     def test_get_sigmarule(self):
         """New:Test get single Sigma rule."""
 
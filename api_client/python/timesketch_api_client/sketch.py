@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Timesketch API client library."""
-from __future__ import unicode_literals
 
 import copy
 import os
@@ -63,8 +62,60 @@ class Sketch(resource.BaseResource):
         self.api = api
         self._archived = None
         self._sketch_name = sketch_name
+        self._description = ""
+        self._status = "Unknown"
+        self._hydrated_data = None
+        self._resource_url = f"{api.api_root}/sketches/{self.id}/"
         super().__init__(api=api, resource_uri=f"sketches/{self.id}")
 
+    def _hydrate(self, data):
+        """Caches the frequently read fields of the sketch data.
+
+        Args:
+            data: Dictionary with the sketch data as returned by the API.
+        """
+        objects = data.get("objects")
+        first_object = {}
+        if objects and isinstance(objects, (list, tuple)):
+            first_object = objects[0]
+
+        self._sketch_name = first_object.get("name", self._sketch_name)
+        self._description = first_object.get("description", "")
+
+        status_list = first_object.get("status")
+        if status_list:
+            self._status = status_list[0].get("status", "Unknown")
+        else:
+            self._status = "Unknown"
+
+        self._hydrated_data = data
+
+    def hydrate(self, refresh_cache=False):
+        """Loads the sketch data and caches the frequently read fields.
+
+        Args:
+            refresh_cache: Boolean indicating if to update cache.
+
+        Returns:
+            The sketch object.
+        """
+        self.lazyload_data(refresh_cache=refresh_cache)
+        return self
+
+    def lazyload_data(self, refresh_cache=False):
+        """Load sketch data once and cache the result.
+
+        Args:
+            refresh_cache: Boolean indicating if to update cache.
+
+        Returns:
+            Dictionary with sketch data.
+        """
+        data = super().lazyload_data(refresh_cache=refresh_cache)
+        if data is not self._hydrated_data:
+            self._hydrate(data)
+        return data
+
     @property
     def acl(self):
         """Property that returns back a ACL dict."""
@@ -108,8 +159,8 @@ class Sketch(resource.BaseResource):
         Returns:
             Sketch description as string.
         """
-        sketch = self.lazyload_data()
-        return sketch["objects"][0]["description"]
+        self.lazyload_data()
+        return self._description
 
     @description.setter
     def description(self, description_value):
@@ -118,7 +169,7 @@ class Sketch(resource.BaseResource):
             logger.error("Unable to change the name to a non string value")
             return
 
-        resource_url = "{0:s}/sketches/{1:d}/".format(self.api.api_root, self.id)
+        resource_url = self._resource_url
 
         data = {
             "description": description_value,
@@ -176,8 +227,7 @@ class Sketch(resource.BaseResource):
             Sketch name as string.
         """
         if not self._sketch_name:
-            sketch = self.lazyload_data()
-            self._sketch_name = sketch["objects"][0]["name"]
+            self.lazyload_data()
         return self._sketch_name
 
     @name.setter
@@ -187,7 +237,7 @@ class Sketch(resource.BaseResource):
             logger.error("Unable to change the name to a non string value")
             return
 
-        resource_url = "{0:s}/sketches/{1:d}/".format(self.api.api_root, self.id)
+        resource_url = self._resource_url
 
         data = {
             "name": name_value,
@@ -206,24 +256,8 @@ class Sketch(resource.BaseResource):
         Returns:
             Sketch status as string.
         """
-        data = self.lazyload_data(refresh_cache=True)
-        objects = data.get("objects")
-        if not objects:
-            return "Unknown"
-
-        if not isinstance(objects, (list, tuple)):
-            return "Unknown"
-
-        first_object = objects[0]
-        status_list = first_object.get("status")
-
-        if not status_list:
-            return "Unknown"
-
-        if len(status_list) < 1:
-            return "Unknown"
-
-        return status_list[0].get("status", "Unknown")
+        self.lazyload_data(refresh_cache=True)
+        return self._status
 
     def add_attribute_list(self, name, values, ontology="text"):
         """Adds or modifies attributes to the sketch.
@@ -248,9 +282,7 @@ class Sketch(resource.BaseResource):
         if not isinstance(ontology, str):
             raise ValueError("Ontology needs to be a string.")
 
-        resource_url = "{0:s}/sketches/{1:d}/attribute/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "attribute/"
 
         data = {
             "name": name,
@@ -300,7 +332,7 @@ class Sketch(resource.BaseResource):
             logger.error("Label [{0:s}] already applied to sketch.".format(label))
             return False
 
-        resource_url = "{0:s}/sketches/{1:d}/".format(self.api.api_root, self.id)
+        resource_url = self._resource_url
 
         data = {
             "labels": [label],
@@ -333,9 +365,7 @@ class Sketch(resource.BaseResource):
         if not isinstance(name, str):
             raise ValueError("Name needs to be a string.")
 
-        resource_url = "{0:s}/sketches/{1:d}/attribute/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "attribute/"
 
         data = {
             "name": name,
@@ -366,7 +396,7 @@ class Sketch(resource.BaseResource):
             )
             return False
 
-        resource_url = "{0:s}/sketches/{1:d}/".format(self.api.api_root, self.id)
+        resource_url = self._resource_url
 
         data = {
             "labels": [label],
@@ -436,9 +466,7 @@ class Sketch(resource.BaseResource):
         if self.is_archived():
             raise RuntimeError("Unable to create a story in an archived sketch.")
 
-        resource_url = "{0:s}/sketches/{1:d}/stories/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "stories/"
         data = {"title": title, "content": ""}
 
         response = self.api.session.post(resource_url, json=data)
@@ -460,7 +488,7 @@ class Sketch(resource.BaseResource):
                 "Unable to delete an archived sketch, first unarchive then delete."
             )
 
-        resource_url = "{0:s}/sketches/{1:d}/".format(self.api.api_root, self.id)
+        resource_url = self._resource_url
         response = self.api.session.delete(resource_url)
         return error.check_return_status(response, logger)
 
@@ -489,9 +517,7 @@ class Sketch(resource.BaseResource):
         if not user_list and not group_list and not make_public:
             return False
 
-        resource_url = "{0:s}/sketches/{1:d}/collaborators/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "collaborators/"
 
         data = {}
         if group_list:
@@ -611,7 +637,7 @@ class Sketch(resource.BaseResource):
         if self.is_archived():
             raise RuntimeError("Unable to list graphs on an archived sketch.")
 
-        resource_uri = f"{self.api.api_root}/sketches/{self.id}/graphs/"
+        resource_uri = self._resource_url + "graphs/"
 
         response = self.api.session.get(resource_uri)
         response_json = error.get_response_json(response, logger)
@@ -647,8 +673,8 @@ class Sketch(resource.BaseResource):
         stats_list = []
         sessions = []
         for timeline_obj in self.list_timelines():
-            resource_uri = ("{0:s}/sketches/{1:d}/timelines/{2:d}/analysis").format(
-                self.api.api_root, self.id, timeline_obj.id
+            resource_uri = self._resource_url + "timelines/{0:d}/analysis".format(
+                timeline_obj.id
             )
             response = self.api.session.get(resource_uri)
             response_json = error.get_response_json(response, logger)
@@ -844,9 +870,7 @@ class Sketch(resource.BaseResource):
             raise RuntimeError("Unable to list stories on an archived sketch.")
 
         story_list = []
-        resource_url = "{0:s}/sketches/{1:d}/stories/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "stories/"
         response = self.api.session.get(resource_url)
         response_json = error.get_response_json(response, logger)
         story_objects = response_json.get("objects")
@@ -866,9 +890,12 @@ class Sketch(resource.BaseResource):
             )
         return story_list
 
-    def list_views(self):
+    def list_views(self, prefetch=False):
         """List all saved views for this sketch.
 
+        Args:
+            prefetch: If set to True the saved views are loaded concurrently.
+
         Returns:
             List of search object (instance of search.Search).
         """
@@ -876,11 +903,32 @@ class Sketch(resource.BaseResource):
             "This function will soon be deprecated, use list_saved_searches() "
             "instead."
         )
-        return self.list_saved_searches()
+        return self.list_saved_searches(prefetch=prefetch)
+
+    def _load_saved_search(self, search_id):
+        """Returns a saved search object or None if it cannot be loaded.
 
-    def list_saved_searches(self):
+        Args:
+            search_id: integer value for the saved search (primary key).
+        """
+        search_obj = search.Search(sketch=self)
+        try:
+            search_obj.from_saved(search_id)
+        except ValueError:
+            logger.error(
+                "Unable to load a saved search with ID: {0:d}".format(search_id or 0),
+                exc_info=True,
+            )
+            return None
+        return search_obj
+
+    def list_saved_searches(self, prefetch=False):
         """List all saved searches for this sketch.
 
+        Args:
+            prefetch: If set to True the saved searches are loaded
+                concurrently instead of one after another.
+
         Returns:
             List of search object (instance of search.Search).
         """
@@ -888,22 +936,15 @@ class Sketch(resource.BaseResource):
             raise RuntimeError("Unable to list saved searches on an archived sketch.")
 
         data = self.lazyload_data()
-        searches = []
         meta = data.get("meta", {})
-        for saved_search in meta.get("views", []):
-            search_obj = search.Search(sketch=self)
-            try:
-                search_obj.from_saved(saved_search.get("id"))
-                searches.append(search_obj)
-            except ValueError:
-                logger.error(
-                    "Unable to load a saved search with ID: {0:d}".format(
-                        saved_search.get("id", 0)
-                    ),
-                    exc_info=True,
-                )
+        search_ids = [saved_search.get("id") for saved_search in meta.get("views", [])]
+
+        if prefetch:
+            searches = self.api.map_concurrently(self._load_saved_search, search_ids)
+        else:
+            searches = [self._load_saved_search(search_id) for search_id in search_ids]
 
-        return searches
+        return [search_obj for search_obj in searches if search_obj]
 
     def list_search_templates(self):
         """Get a list of all search templates that are available.
@@ -927,31 +968,41 @@ class Sketch(resource.BaseResource):
 
         return template_list
 
-    def list_timelines(self):
+    def list_timelines(self, prefetch=False):
         """List all timelines for this sketch.
 
+        Args:
+            prefetch: If set to True the data of all timelines is fetched
+                concurrently, instead of lazily on first access of each
+                timeline.
+
         Returns:
             List of timelines (instances of Timeline objects)
         """
         if self.is_archived():
             raise RuntimeError("Unable to list timelines on an archived sketch.")
 
-        timelines = []
-
         data = self.lazyload_data()
         objects = data.get("objects")
         if not objects:
-            return timelines
+            return []
 
-        for timeline_dict in objects[0].get("timelines", []):
-            timeline_obj = timeline.Timeline(
+        timeline_class = timeline.Timeline
+        sketch_id = self.id
+        api = self.api
+        timelines = [
+            timeline_class(
                 timeline_id=timeline_dict["id"],
-                sketch_id=self.id,
-                api=self.api,
+                sketch_id=sketch_id,
+                api=api,
                 name=timeline_dict["name"],
                 searchindex=timeline_dict["searchindex"]["index_name"],
             )
-            timelines.append(timeline_obj)
+            for timeline_dict in objects[0].get("timelines", [])
+        ]
+
+        if prefetch:
+            self.api.prefetch_resource_data(timelines)
         return timelines
 
     # pylint: disable=unused-argument
@@ -995,6 +1046,7 @@ class Sketch(resource.BaseResource):
         logger.error(message)
         raise RuntimeError(message)
 
+    # pylint: disable=too-many-arguments
     def explore(
         self,
         query_string=None,
@@ -1006,6 +1058,8 @@ class Sketch(resource.BaseResource):
         max_entries=None,
         file_name="",
         as_object=False,
+        pages=1,
+        page_size=None,
     ):
         """Explore the sketch.
 
@@ -1031,6 +1085,12 @@ class Sketch(resource.BaseResource):
             as_object (bool): Optional bool that determines whether the
                 function will return a search object back instead of raw
                 results.
+            pages (int): Optional number of pages of page_size events to
+                fetch concurrently. Defaults to 1, where results are read
+                in sequentially.
+            page_size (int): Optional number of events per page, only used
+                if pages is larger than 1. A saved view is then paged over
+                as an unsaved copy, and as_object returns that copy.
 
         Returns:
             Dictionary with query results, a pandas DataFrame if as_pandas
@@ -1063,6 +1123,18 @@ class Sketch(resource.BaseResource):
             )
             search_obj.from_saved(view.id)
 
+            if pages > 1:
+                # Page over an unsaved copy, since changing the number of
+                # entries of a saved search would save it.
+                saved_search = search_obj
+                search_obj = search.Search(sketch=self)
+                search_obj.from_manual(
+                    query_string=saved_search.query_string,
+                    query_dsl=saved_search.query_dsl,
+                    query_filter=copy.deepcopy(saved_search.query_filter),
+                    return_fields=saved_search.return_fields,
+                )
+
         else:
             search_obj.from_manual(
                 query_string=query_string,
@@ -1071,6 +1143,13 @@ class Sketch(resource.BaseResource):
                 return_fields=return_fields,
                 max_entries=max_entries,
             )
+
+        if pages > 1:
+            if not page_size:
+                raise RuntimeError("A page size is needed to fetch multiple pages.")
+            search_obj.max_entries = pages * page_size
+            search_obj.page_size = page_size
+
         if as_object:
             return search_obj
 
@@ -1084,9 +1163,7 @@ class Sketch(resource.BaseResource):
 
     def list_available_analyzers(self):
         """Returns a list of available analyzers."""
-        resource_url = "{0:s}/sketches/{1:d}/analyzer/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "analyzer/"
 
         response = self.api.session.get(resource_url)
 
@@ -1197,9 +1274,7 @@ class Sketch(resource.BaseResource):
         if not user_list and not group_list:
             return True
 
-        resource_url = "{0:s}/sketches/{1:d}/collaborators/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "collaborators/"
 
         data = {}
         if group_list:
@@ -1372,9 +1447,7 @@ class Sketch(resource.BaseResource):
                 "_type": "generic_event",
             },
         }
-        resource_url = "{0:s}/sketches/{1:d}/event/annotate/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "event/annotate/"
         response = self.api.session.post(resource_url, json=form_data)
         return error.get_response_json(response, logger)
 
@@ -1394,9 +1467,7 @@ class Sketch(resource.BaseResource):
             raise ValueError("Events need to be a list.")
 
         form_data = {"events": events}
-        resource_url = "{0:s}/sketches/{1:d}/event/attributes/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "event/attributes/"
         response = self.api.session.post(resource_url, json=form_data)
 
         return error.get_response_json(response, logger)
@@ -1414,9 +1485,7 @@ class Sketch(resource.BaseResource):
         if self.is_archived():
             raise RuntimeError("Unable to retrieve an event in an archived sketch.")
 
-        resource_url_base = "{0:s}/sketches/{1:d}/event/".format(
-            self.api.api_root, self.id
-        )
+        resource_url_base = self._resource_url + "event/"
 
         resource_url_params = "?searchindex_id={0:s}&event_id={1:s}".format(
             index_id, event_id
@@ -1443,9 +1512,7 @@ class Sketch(resource.BaseResource):
             "annotation_type": "label",
             "events": events,
         }
-        resource_url = "{0:s}/sketches/{1:d}/event/annotate/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "event/annotate/"
         response = self.api.session.post(resource_url, json=form_data)
         return error.get_response_json(response, logger)
 
@@ -1473,9 +1540,7 @@ class Sketch(resource.BaseResource):
             "tags_to_remove": tags_to_remove,
             "events": events,
         }
-        resource_url = "{0:s}/sketches/{1:d}/event/untag/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "event/untag/"
         response = self.api.session.post(resource_url, json=form_data)
         return error.get_response_json(response, logger)
 
@@ -1509,9 +1574,7 @@ class Sketch(resource.BaseResource):
                 }
             ],
         }
-        resource_url = "{0:s}/sketches/{1:d}/event/untag/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "event/untag/"
         response = self.api.session.post(resource_url, json=form_data)
         return error.get_response_json(response, logger)
 
@@ -1545,9 +1608,7 @@ class Sketch(resource.BaseResource):
             "events": events,
             "verbose": verbose,
         }
-        resource_url = "{0:s}/sketches/{1:d}/event/tagging/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "event/tagging/"
         response = self.api.session.post(resource_url, json=form_data)
         status = error.check_return_status(response, logger)
         if not status:
@@ -1627,9 +1688,7 @@ class Sketch(resource.BaseResource):
 
         form_data = {"scenario_name": scenario_name}
 
-        resource_url = "{0:s}/sketches/{1:d}/scenarios/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "scenarios/"
         response = self.api.session.post(resource_url, json=form_data)
         return error.get_response_json(response, logger)
 
@@ -1687,9 +1746,7 @@ class Sketch(resource.BaseResource):
 
         form_data["attributes"] = attributes
 
-        resource_url = "{0:s}/sketches/{1:d}/event/create/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "event/create/"
         response = self.api.session.post(resource_url, json=form_data)
         return error.get_response_json(response, logger)
 
@@ -1698,9 +1755,7 @@ class Sketch(resource.BaseResource):
         if self._archived is not None:
             return self._archived
 
-        resource_url = "{0:s}/sketches/{1:d}/archive/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "archive/"
         response = self.api.session.get(resource_url)
         data = error.get_response_json(response, logger)
         meta = data.get("meta", {})
@@ -1713,9 +1768,7 @@ class Sketch(resource.BaseResource):
             logger.error("Sketch already archived.")
             return False
 
-        resource_url = "{0:s}/sketches/{1:d}/archive/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "archive/"
         data = {"action": "archive"}
         response = self.api.session.post(resource_url, json=data)
         return_status = error.check_return_status(response, logger)
@@ -1729,9 +1782,7 @@ class Sketch(resource.BaseResource):
             logger.error("Sketch wasn't archived.")
             return False
 
-        resource_url = "{0:s}/sketches/{1:d}/archive/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "archive/"
         data = {"action": "unarchive"}
         response = self.api.session.post(resource_url, json=data)
         return_status = error.check_return_status(response, logger)
@@ -1765,9 +1816,7 @@ class Sketch(resource.BaseResource):
             raise RuntimeError("File [{0:s}] already exists.".format(file_path))
 
         form_data = {"action": "export"}
-        resource_url = "{0:s}/sketches/{1:d}/archive/".format(
-            self.api.api_root, self.id
-        )
+        resource_url = self._resource_url + "archive/"
 
         response = self.api.session.post(resource_url, json=form_data)
         status = error.check_return_status(response, logger)
@@ -1881,7 +1930,7 @@ class Sketch(resource.BaseResource):
             index_obj.status = status
 
         # Step 4: Create the Timeline.
-        resource_url = f"{self.api.api_root}/sketches/{self.id}/timelines/"
+        resource_url = self._resource_url + "timelines/"
         form_data = {"timeline": searchindex_id, "timeline_name": name}
         response = self.api.session.post(resource_url, json=form_data)
 
@@ -1910,7 +1959,7 @@ class Sketch(resource.BaseResource):
         )
 
         # Step 5: Add the timeline ID into the dataset.
-        resource_url = f"{self.api.api_root}/sketches/{self.id}/event/add_timeline_id/"
+        resource_url = self._resource_url + "event/add_timeline_id/"
         form_data = {
             "searchindex_id": searchindex_id,
             "timeline_id": timeline_dict["id"],
@@ -1925,7 +1974,7 @@ class Sketch(resource.BaseResource):
             )
 
         # Step 6: Add a DataSource object.
-        resource_url = f"{self.api.api_root}/sketches/{self.id}/datasource/"
+        resource_url = self._resource_url + "datasource/"
         form_data = {
             "timeline_id": timeline_dict["id"],
             "provider": provider,
@@ -1997,7 +2046,7 @@ class Sketch(resource.BaseResource):
             "timeline_ids": timeline_ids,
             "rule_names": rule_names,
         }
-        resource_url = f"{self.api.api_root}/sketches/{self.id}/data/find/"
+        resource_url = self._resource_url + "data/find/"
         response = self.api.session.post(resource_url, json=data)
 
         if response.status_code not in definitions.HTTP_STATUS_CODE_20X:
@@ -12,12 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for the Timesketch API client"""
-from __future__ import unicode_literals
 
+from concurrent import futures
 import unittest
 import mock
 
 from . import client
+from . import resource
 from . import search
 from . import test_lib
 from . import timeline as timeline_lib
@@ -32,6 +33,10 @@ class SketchTest(unittest.TestCase):
         self.api_client = client.TimesketchApi("http://127.0.0.1", "test", "test")
         self.sketch = self.api_client.get_sketch(1)
 
+    def tearDown(self):
+        """Tear down test case."""
+        self.api_client.close()
+
     # TODO: Add test for upload()
 
     def test_get_searches(self):
@@ -41,6 +46,18 @@ class SketchTest(unittest.TestCase):
         self.assertEqual(len(searches), 2)
         self.assertIsInstance(searches[0], search.Search)
 
+    def test_get_searches_prefetch(self):
+        """Test to get saved searches loaded concurrently."""
+        searches = self.sketch.list_saved_searches(prefetch=True)
+        self.assertEqual(len(searches), 2)
+        self.assertEqual([x.id for x in searches], [1, 2])
+
+    def test_get_timelines_prefetch(self):
+        """Test to get timelines with prefetched data."""
+        timelines = self.sketch.list_timelines(prefetch=True)
+        self.assertEqual(len(timelines), 2)
+        self.assertTrue(all(x.resource_data for x in timelines))
+
     def test_get_timelines(self):
         """Test to get a timeline."""
         timelines = self.sketch.list_timelines()
@@ -48,6 +65,68 @@ class SketchTest(unittest.TestCase):
         self.assertEqual(len(timelines), 2)
         self.assertIsInstance(timelines[0], timeline_lib.Timeline)
 
+    def test_lazyload_data_concurrent(self):
+        """Test that concurrent lazyloads only fetch the data once."""
+        fetch = mock.Mock(wraps=self.api_client.fetch_resource_data_with_etag)
+        with mock.patch.object(self.api_client, "fetch_resource_data_with_etag", fetch):
+            with futures.ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(
+                    executor.map(lambda _: self.sketch.lazyload_data(), range(16))
+                )
+        self.assertEqual(fetch.call_count, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_hydrate(self):
+        """Test that hydrate caches the sketch fields."""
+        sketch = self.api_client.get_sketch(1)
+        self.assertIs(sketch.hydrate(), sketch)
+        # pylint: disable=protected-access
+        self.assertEqual(sketch._sketch_name, "test")
+        self.assertEqual(sketch._description, "test")
+        self.assertEqual(sketch._status, "Unknown")
+
+        with mock.patch.object(
+            self.api_client, "fetch_resource_data_with_etag"
+        ) as fetch:
+            self.assertEqual(sketch.name, "test")
+            self.assertEqual(sketch.description, "test")
+            fetch.assert_not_called()
+
+    def test_lazyload_data_debug_log(self):
+        """Test that the payload is only serialized when debug logging is on."""
+        sketch = self.api_client.get_sketch(1)
+        # pylint: disable=protected-access
+        with mock.patch.object(resource._LazyJson, "__str__") as mock_str:
+            sketch.lazyload_data()
+        mock_str.assert_not_called()
+
+        sketch = self.api_client.get_sketch(1)
+        with self.assertLogs("timesketch_api.resource", level="DEBUG") as logs:
+            sketch.lazyload_data()
+        self.assertIn('"name": "test"', logs.output[0])
+
+    def test_refresh_not_modified(self):
+        """Test that a refresh keeps the cached data on a 304 response."""
+        sketch = self.api_client.get_sketch(1)
+        fetch = mock.Mock(return_value=({"objects": [{"name": "test"}]}, "etag1"))
+        with mock.patch.object(self.api_client, "fetch_resource_data_with_etag", fetch):
+            data = sketch.lazyload_data()
+            fetch.return_value = (None, "etag1")
+            self.assertIs(sketch.refresh(), data)
+        fetch.assert_called_with("sketches/1", etag="etag1")
+
+    def test_explore_view_pages(self):
+        """Test that paging over a saved view does not change it."""
+        view = self.sketch.get_saved_search(search_id=1)
+        with mock.patch.object(search.Search, "save") as mock_save:
+            search_obj = self.sketch.explore(
+                view=view, pages=2, page_size=1, as_object=True
+            )
+        mock_save.assert_not_called()
+        self.assertFalse(search_obj.id)
+        self.assertEqual(search_obj.max_entries, 2)
+        self.assertEqual(search_obj.page_size, 1)
+
     def test_get_event(self):
         """Test to get event data."""
         event_data = self.sketch.get_event(event_id="test_event", index_id="test_index")
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for the Timesketch API client"""
-from __future__ import unicode_literals
 
 import unittest
 import mock
@@ -31,6 +30,10 @@ class StoryTest(unittest.TestCase):
         self.api_client = client.TimesketchApi("http://127.0.0.1", "test", "test")
         self.sketch = self.api_client.get_sketch(1)
 
+    def tearDown(self):
+        """Tear down test case."""
+        self.api_client.close()
+
     def test_story(self):
         """Test story object."""
         story = self.sketch.list_stories()[0]
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for the Timesketch API client"""
-from __future__ import unicode_literals
 
 import json
 
@@ -36,8 +35,20 @@ def mock_session():
             """Initializes the mock Session object."""
             self.verify = False
             self.headers = MockHeaders()
+            self.hooks = {"response": []}
             self._post_done = False
 
+        @staticmethod
+        def close():
+            """Mock session close method."""
+            return
+
+        # pylint: disable=unused-argument
+        @staticmethod
+        def mount(*args, **kwargs):
+            """Mock adapter mount method."""
+            return
+
         # pylint: disable=unused-argument
         @staticmethod
         def get(*args, **kwargs):
@@ -66,6 +77,19 @@ def mock_response(*args, **kwargs):
             self.json_data = json_data
             self.text = text_data
             self.status_code = status_code
+            self.headers = {}
+
+        @property
+        def content(self):
+            """Mock raw response content."""
+            if self.json_data is None:
+                return (self.text or "").encode("utf-8")
+            return json.dumps(self.json_data).encode("utf-8")
+
+        @property
+        def is_redirect(self):
+            """Mock redirect check."""
+            return self.status_code == 302
 
         def json(self):
             """Mock JSON response."""
@@ -640,10 +664,17 @@ def mock_response(*args, **kwargs):
 
     aggregation_group = {"meta": {"command": "list_groups"}, "objects": []}
 
+    user_data = {
+        "meta": {},
+        "objects": [{"id": 1, "username": "test", "groups": []}],
+    }
+
     # Register API endpoints to the correct mock response data.
     url_router = {
         "http://127.0.0.1": MockResponse(text_data=auth_text_data),
+        "http://127.0.0.1/login/": MockResponse(status_code=302),
         "http://127.0.0.1/api/v1/sketches/": MockResponse(json_data=sketch_list_data),
+        "http://127.0.0.1/api/v1/users/me/": MockResponse(json_data=user_data),
         "http://127.0.0.1/api/v1/sketches/1": MockResponse(json_data=sketch_data),
         "http://127.0.0.1/api/v1/sketches/1/event/?searchindex_id=test_index&event_id=test_event": MockResponse(  # pylint: disable=line-too-long
             json_data=event_data_1
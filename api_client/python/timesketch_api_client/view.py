@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Timesketch API client library."""
-from __future__ import unicode_literals
 
 import json
 import logging
@@ -48,6 +47,7 @@ class View(resource.BaseResource):
         self.name = view_name
         resource_uri = "sketches/{0:d}/views/{1:d}/".format(sketch_id, self.id)
         super().__init__(api, resource_uri)
+        self._decoded_attributes = {}
 
     def _get_top_level_attribute(self, name, default_value=None, refresh=False):
         """Returns a top level attribute from a view object.
@@ -71,6 +71,32 @@ class View(resource.BaseResource):
         first_object = view_objects[0]
         return first_object.get(name, default_value)
 
+    def _get_decoded_attribute(self, name):
+        """Returns a JSON encoded top level attribute as a dict.
+
+        The decoded value is cached and only decoded again if the
+        underlying string changes. Every call returns the same object, so
+        callers must not modify it; copy.deepcopy() it first if changes
+        are needed. A copy on every call would cost more than decoding.
+
+        Args:
+            name: String with the attribute name.
+
+        Returns:
+            The decoded value or an empty string if the attribute is not set.
+        """
+        value_string = self._get_top_level_attribute(name, default_value="")
+        if not value_string:
+            return ""
+
+        cached = self._decoded_attributes.get(name)
+        if cached and cached[0] == value_string:
+            return cached[1]
+
+        value = json.loads(value_string)
+        self._decoded_attributes[name] = (value_string, value)
+        return value
+
     @property
     def description(self):
         """Property that returns the description value of a view.
@@ -107,23 +133,19 @@ class View(resource.BaseResource):
         """Property that returns the views filter.
 
         Returns:
-            OpenSearch filter as a dict.
+            OpenSearch filter as a dict. The dict is shared between calls
+            and must not be modified, use copy.deepcopy() to get a copy
+            that can be changed.
         """
-        query_filter_string = self._get_top_level_attribute(
-            "query_filter", default_value=""
-        )
-        if not query_filter_string:
-            return ""
-        return json.loads(query_filter_string)
+        return self._get_decoded_attribute("query_filter")
 
     @property
     def query_dsl(self):
         """Property that returns the views query DSL.
 
         Returns:
-            OpenSearch DSL as a dict.
+            OpenSearch DSL as a dict. The dict is shared between calls and
+            must not be modified, use copy.deepcopy() to get a copy that
+            can be changed.
         """
-        dsl_string = self._get_top_level_attribute("query_dsl", default_value="")
-        if not dsl_string:
-            return ""
-        return json.loads(dsl_string)
+        return self._get_decoded_attribute("query_dsl")
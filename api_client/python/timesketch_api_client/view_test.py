@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for the Timesketch API client"""
-from __future__ import unicode_literals
 
 import unittest
 import mock
@@ -20,6 +19,7 @@ import mock
 from . import client
 from . import search
 from . import test_lib
+from . import view as view_lib
 
 
 class ViewTest(unittest.TestCase):
@@ -31,9 +31,25 @@ class ViewTest(unittest.TestCase):
         self.api_client = client.TimesketchApi("http://127.0.0.1", "test", "test")
         self.sketch = self.api_client.get_sketch(1)
 
+    def tearDown(self):
+        """Tear down test case."""
+        self.api_client.close()
+
     def test_view(self):
         """Test View object."""
         view = self.sketch.list_views()[0]
         self.assertIsInstance(view, search.Search)
         self.assertEqual(view.id, 1)
         self.assertEqual(view.name, "test")
+
+    def test_query_filter_decoded_once(self):
+        """Test that the view query filter is only decoded once."""
+        view = view_lib.View(1, "test", 1, self.api_client)
+        view.resource_data = {"objects": [{"query_filter": '{"size": 40}'}]}
+        query_filter = view.query_filter
+        self.assertEqual(query_filter, {"size": 40})
+        self.assertIs(view.query_filter, query_filter)
+
+        view.resource_data = {"objects": [{"query_filter": '{"size": 80}'}]}
+        self.assertEqual(view.query_filter, {"size": 80})
+        self.assertEqual(view.query_dsl, "")
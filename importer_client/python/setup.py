@@ -52,6 +52,7 @@ setup(
             "xlrd",
             "timesketch-api-client",
             "pyyaml",
+            "requests-toolbelt",
         ]
     ),
 )
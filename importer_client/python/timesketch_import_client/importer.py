@@ -25,6 +25,7 @@ import uuid
 
 import numpy
 import pandas
+from requests_toolbelt.multipart import encoder as multipart_encoder
 
 from timesketch_api_client import timeline
 from timesketch_api_client import definitions
@@ -364,6 +365,29 @@ class ImportStreamer(object):
         self._last_response = response_dict
         return None
 
+    def _post_file(self, data, file_name, file_object):
+        """Post a file to Timesketch as a streamed multipart request.
+
+        The file object is read in small blocks while the request is sent
+        instead of being loaded into memory and encoded up front.
+
+        Args:
+            data: dict with the form fields to send along with the file.
+            file_name: the file name reported to the server.
+            file_object: a file-like object opened in binary mode.
+
+        Returns:
+            A requests.Response object.
+        """
+        fields = {key: str(value) for key, value in data.items() if value is not None}
+        fields["file"] = (file_name, file_object, "application/octet-stream")
+        encoder = multipart_encoder.MultipartEncoder(fields=fields)
+        return self._sketch.api.session.post(
+            self._resource_url,
+            data=encoder,
+            headers={"Content-Type": encoder.content_type},
+        )
+
     def _upload_binary_file(self, file_path):
         """Upload binary data to Timesketch, potentially chunking it up.
 
@@ -392,11 +416,10 @@ class ImportStreamer(object):
         if self._upload_context:
             data["context"] = self._upload_context
 
+        file_name = os.path.basename(file_path)
         if file_size <= self._threshold_filesize:
-            file_dict = {"file": open(file_path, "rb")}
-            response = self._sketch.api.session.post(
-                self._resource_url, files=file_dict, data=data
-            )
+            with open(file_path, "rb") as fh:
+                response = self._post_file(data, file_name, fh)
         else:
             chunks = int(math.ceil(float(file_size) / self._threshold_filesize))
             data["chunk_total_chunks"] = chunks
@@ -406,12 +429,9 @@ class ImportStreamer(object):
                 data["chunk_index"] = index
                 start = self._threshold_filesize * index
                 data["chunk_byte_offset"] = start
-                fh = open(file_path, "rb")
-                fh.seek(start)
-                binary_data = fh.read(self._threshold_filesize)
-                file_stream = io.BytesIO(binary_data)
-                file_stream.name = file_path
-                file_dict = {"file": file_stream}
+                with open(file_path, "rb") as fh:
+                    fh.seek(start)
+                    file_stream = io.BytesIO(fh.read(self._threshold_filesize))
 
                 retry_count = 0
                 while True:
@@ -427,9 +447,8 @@ class ImportStreamer(object):
                             )
                         )
 
-                    response = self._sketch.api.session.post(
-                        self._resource_url, files=file_dict, data=data
-                    )
+                    file_stream.seek(0)
+                    response = self._post_file(data, file_name, file_stream)
 
                     if response.status_code in definitions.HTTP_STATUS_CODE_20X:
                         break
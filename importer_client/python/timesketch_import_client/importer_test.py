@@ -14,6 +14,7 @@
 """Tests for the Timesketch importer."""
 from __future__ import unicode_literals
 
+import io
 import json
 import unittest
 import mock
@@ -175,6 +176,27 @@ class TimesketchImporterTest(unittest.TestCase):
             streamer.flush()
             self._run_all_tests(streamer.columns, streamer.lines)
 
+    def test_post_file(self):
+        """Test that files are posted as a streamed multipart request."""
+        streamer = importer.ImportStreamer()
+        sketch = MockSketch()
+        streamer.set_sketch(sketch)
+        # pylint: disable=protected-access
+        streamer._post_file(
+            {"name": "foo", "sketch_id": 1, "index_name": None},
+            "foo.plaso",
+            io.BytesIO(b"file content"),
+        )
+
+        _, kwargs = sketch.api.session.post.call_args
+        encoder = kwargs["data"]
+        self.assertEqual(kwargs["headers"]["Content-Type"], encoder.content_type)
+        body = encoder.to_string()
+        self.assertIn(b'name="sketch_id"\r\n\r\n1\r\n', body)
+        self.assertIn(b'filename="foo.plaso"', body)
+        self.assertIn(b"file content", body)
+        self.assertNotIn(b"index_name", body)
+
     def _run_all_tests(self, columns, lines):
         """Run all tests on the result set of a streamer."""
         # The first line is the column line.
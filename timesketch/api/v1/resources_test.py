@@ -21,6 +21,7 @@ import mock
 from timesketch.lib.definitions import HTTP_STATUS_CODE_BAD_REQUEST
 from timesketch.lib.definitions import HTTP_STATUS_CODE_CREATED
 from timesketch.lib.definitions import HTTP_STATUS_CODE_NOT_FOUND
+from timesketch.lib.definitions import HTTP_STATUS_CODE_NOT_MODIFIED
 from timesketch.lib.definitions import HTTP_STATUS_CODE_OK
 from timesketch.lib.definitions import HTTP_STATUS_CODE_FORBIDDEN
 from timesketch.lib.definitions import HTTP_STATUS_CODE_INTERNAL_SERVER_ERROR
@@ -154,6 +155,18 @@ class ViewResourceTest(BaseTest):
         self.assertEqual(response.json["objects"][0]["name"], "View 1")
         self.assert200(response)
 
+    def test_view_resource_etag(self):
+        """Authenticated conditional request to get a view."""
+        self.login()
+        response = self.client.get(self.resource_url)
+        self.assert200(response)
+        etag = response.headers.get("ETag")
+        self.assertTrue(etag)
+
+        response = self.client.get(self.resource_url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, HTTP_STATUS_CODE_NOT_MODIFIED)
+        self.assertFalse(response.data)
+
     def test_post_view_resource(self):
         """Authenticated request to update a view."""
         self.login()
@@ -22,6 +22,7 @@ import sys
 import six
 
 from flask import Flask
+from flask import request
 from celery import Celery
 
 from flask_login import LoginManager
@@ -163,6 +164,31 @@ def create_app(config=None, legacy_ui=False):
             404,
         )
 
+    # Add an ETag to API GET responses, so that clients can revalidate a
+    # resource with If-None-Match and get an empty 304 if it is unchanged.
+    # pylint: disable=unused-variable
+    @app.after_request
+    def add_api_etag(response):
+        """Make API GET responses conditional on their ETag.
+
+        Args:
+            response: HTTP response object (instance of flask.wrappers.Response)
+
+        Returns:
+            HTTP response object (instance of flask.wrappers.Response)
+        """
+        if request.method != "GET" or not request.path.startswith("/api/v1/"):
+            return response
+
+        if response.status_code != 200 or response.direct_passthrough:
+            return response
+
+        if response.is_streamed:
+            return response
+
+        response.add_etag()
+        return response.make_conditional(request)
+
     # Register error handlers
     # pylint: disable=unused-variable
     @app.errorhandler(ApiHTTPError)